@@ -1,10 +1,11 @@
 import asyncio
 import json
 from pathlib import Path
-from xml.dom import minidom
+from tempfile import TemporaryFile
 
 import typer
 import xmltodict
+from lxml import etree
 
 from palace_tools.feeds import axis, opds, opds1, overdrive
 from palace_tools.utils.typer import run_typer_app_as_main
@@ -18,6 +19,9 @@ def download_axis(
     password: str = typer.Option(..., "--password", "-p", help="Password"),
     library_id: str = typer.Option(..., "-l", "--library-id", help="Library ID"),
     output_json: bool = typer.Option(False, "-j", "--json", help="Output JSON file"),
+    pretty_print: bool = typer.Option(
+        True, "--pretty-print/--no-pretty-print", help="Pretty-print XML output"
+    ),
     qa_endpoint: bool = typer.Option(False, "-q", "--qa", help="Use QA Endpoint"),
     output_file: Path = typer.Argument(
         ..., help="Output file", writable=True, file_okay=True, dir_okay=False
@@ -28,16 +32,30 @@ def download_axis(
     # Find the base URL to use
     base_url = axis.PRODUCTION_BASE_URL if not qa_endpoint else axis.QA_BASE_URL
 
-    # Fetch the document as XML
-    xml = axis.availability(base_url, username, password, library_id)
-
-    with output_file.open("w") as file:
-        if output_json:
-            xml_dict = xmltodict.parse(xml)
-            file.write(json.dumps(xml_dict, indent=4))
-        else:
-            parsed = minidom.parseString(xml)
-            file.write(parsed.toprettyxml())
+    if output_json:
+        # Spool the download to disk, and write the JSON straight to the output
+        # file, so that we don't hold the raw or serialized document in memory
+        # alongside the parsed one.
+        with TemporaryFile() as raw, output_file.open("w") as file:
+            axis.availability_stream(base_url, username, password, library_id, raw)
+            raw.seek(0)
+            json.dump(xmltodict.parse(raw), file, indent=4)
+    elif pretty_print:
+        with TemporaryFile() as raw, output_file.open("wb") as file:
+            axis.availability_stream(base_url, username, password, library_id, raw)
+            raw.seek(0)
+            parsed = etree.parse(raw).getroot()
+            file.write(
+                etree.tostring(
+                    parsed,
+                    pretty_print=True,
+                    encoding="utf-8",
+                    xml_declaration=True,
+                )
+            )
+    else:
+        with output_file.open("wb") as file:
+            axis.availability_stream(base_url, username, password, library_id, file)
 
 
 @app.command("overdrive")
@@ -83,7 +101,73 @@ def download_overdrive(
     )
 
     with output_file.open("w") as file:
-        file.write(json.dumps(products, indent=4))
+        json.dump(products, file, indent=4)
+
+
+@app.command("overdrive-batch")
+def download_overdrive_batch(
+    client_key: str = typer.Option(..., "-k", "--client-key", help="Client Key"),
+    client_secret: str = typer.Option(
+        ..., "-s", "--client-secret", help="Client Secret"
+    ),
+    library_ids: str = typer.Option(
+        ..., "-l", "--library-ids", help="Comma-separated list of Library IDs"
+    ),
+    parent_library_id: str = typer.Option(
+        None,
+        "-p",
+        "--parent-library-id",
+        help="Parent Library ID (for Advantage Accounts)",
+    ),
+    fetch_metadata: bool = typer.Option(
+        False, "-m", "--metadata", help="Fetch metadata"
+    ),
+    fetch_availability: bool = typer.Option(
+        False, "-a", "--availability", help="Fetch availability"
+    ),
+    qa_endpoint: bool = typer.Option(False, "-q", "--qa", help="Use QA Endpoint"),
+    connections: int = typer.Option(
+        20, "-c", "--connections", help="Number of connections to use"
+    ),
+    output_dir: Path = typer.Argument(
+        ...,
+        help="Output directory. Each library's feed is written to <library id>.json.",
+        writable=True,
+        file_okay=False,
+        dir_okay=True,
+    ),
+) -> None:
+    """Download Overdrive feeds for several libraries concurrently."""
+    base_url = overdrive.QA_BASE_URL if qa_endpoint else overdrive.PROD_BASE_URL
+    ids = [library_id.strip() for library_id in library_ids.split(",")]
+    try:
+        results = asyncio.run(
+            overdrive.fetch_batch(
+                base_url,
+                client_key,
+                client_secret,
+                [library_id for library_id in ids if library_id],
+                parent_library_id,
+                fetch_metadata,
+                fetch_availability,
+                connections,
+            )
+        )
+    except overdrive.FetchError as e:
+        print(e)
+        raise typer.Exit(code=1)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    failed = False
+    for library_id, products in results.items():
+        if isinstance(products, BaseException):
+            print(f"Error downloading feed for library {library_id}: {products}")
+            failed = True
+            continue
+        with (output_dir / f"{library_id}.json").open("w") as file:
+            json.dump(products, file, indent=4)
+    if failed:
+        raise typer.Exit(code=1)
 
 
 @app.command("opds2")
@@ -16,9 +16,11 @@ from palace_tools.models.api.opds2 import match_links
 from palace_tools.models.api.readium_lcp_license_v1 import LCPLicenseDocument
 from palace_tools.utils.http.async_client import HTTPXAsyncClient
 from palace_tools.utils.http.auth_token import BaseAuthorizationToken, BasicAuthToken
+from palace_tools.utils.http.remote_zip import fetch_zip_member
 from palace_tools.utils.http.streaming import streaming_fetch_with_progress
 from palace_tools.utils.typer import run_typer_app_as_main
 
+CLIENT_HEADERS = {"User-Agent": "Palace"}
 STDOUT = 1
 app = typer.Typer()
 
@@ -112,12 +114,25 @@ async def process_audiobook_manifest_command(
     manifest_member_name: str = "manifest.json",
     pretty_print: bool = False,
 ) -> None:
-    file = BytesIO()
+    async with HTTPXAsyncClient(headers=CLIENT_HEADERS) as client:
+        lcp_audiobook_url = await fetch_lcp_audiobook_url(
+            fulfillment_url, None, username, password, http_client=client
+        )
+        if lcp_audiobook_url is None:
+            print("No LCP audiobook link found in the license.")
+            return
 
-    await process_command(fulfillment_url, None, file, username, password)
+        # Try to fetch only the manifest from the zip, using range requests.
+        manifest = await fetch_zip_member(
+            lcp_audiobook_url, member_name=manifest_member_name, http_client=client
+        )
+        if manifest is None:
+            # The server doesn't support range requests, so download the whole zip.
+            file = BytesIO()
+            await download_lcp_audiobook(lcp_audiobook_url, file, http_client=client)
+            zf = zipfile.ZipFile(file)
+            manifest = zf.read(name=manifest_member_name)
 
-    zf = zipfile.ZipFile(file)
-    manifest = zf.read(name=manifest_member_name)
     print(f"Sending output to {manifest_file}.")
     with open(manifest_file, "w") as f:
         if pretty_print:
@@ -133,35 +148,56 @@ async def process_command(
     username: str,
     password: str | None,
 ) -> None:
-    client_headers = {"User-Agent": "Palace"}
+    async with HTTPXAsyncClient(headers=CLIENT_HEADERS) as client:
+        lcp_audiobook_url = await fetch_lcp_audiobook_url(
+            fulfillment_url, license_file, username, password, http_client=client
+        )
+        if lcp_audiobook_url is None:
+            return
+        await download_lcp_audiobook(lcp_audiobook_url, lcp_file, http_client=client)
+
+
+async def fetch_lcp_audiobook_url(
+    fulfillment_url: str,
+    license_file: TextIO | None,
+    username: str,
+    password: str | None,
+    http_client: HTTPXAsyncClient,
+) -> str | None:
+    """Fetch the LCP license and return the URL of its audiobook, if any.
+
+    If `license_file` is provided, the license document is written to it.
+    """
     token: BaseAuthorizationToken = BasicAuthToken.from_username_and_password(
         username, password
     )
+    response = await http_client.get(fulfillment_url, headers=token.as_http_headers)
+    response.raise_for_status()
 
-    async with HTTPXAsyncClient(headers=client_headers) as client:
-        response = await client.get(fulfillment_url, headers=token.as_http_headers)
-        response.raise_for_status()
+    if license_file:
+        license_file.write(response.text)
 
-        if license_file:
-            license_file.write(response.text)
+    lcp_license = LCPLicenseDocument.model_validate_json(response.content)
+    lcp_audiobook_links = match_links(
+        lcp_license.links,
+        lambda lnk: lnk.rel == LCP_LICENSE_PUBLICATION_REL
+        and lnk.type == LCP_AUDIOBOOK_TYPE,
+    )
+    if not lcp_audiobook_links:
+        return None
+    return str(lcp_audiobook_links[0].href)
 
-        lcp_license = LCPLicenseDocument.model_validate(response.json())
-        lcp_audiobook_links = match_links(
-            lcp_license.links,
-            lambda lnk: lnk.rel == LCP_LICENSE_PUBLICATION_REL
-            and lnk.type == LCP_AUDIOBOOK_TYPE,
-        )
-        if not lcp_audiobook_links:
-            return
-        lcp_audiobook_url = lcp_audiobook_links[0].href
 
-        lcp_audiobook_response = await streaming_fetch_with_progress(
-            str(lcp_audiobook_url),
-            lcp_file,
-            task_label="Downloading audiobook zip...",
-            http_client=client,
-        )
-        lcp_audiobook_response.raise_for_status()
+async def download_lcp_audiobook(
+    lcp_audiobook_url: str, lcp_file: BinaryIO, http_client: HTTPXAsyncClient
+) -> None:
+    lcp_audiobook_response = await streaming_fetch_with_progress(
+        lcp_audiobook_url,
+        lcp_file,
+        task_label="Downloading audiobook zip...",
+        http_client=http_client,
+    )
+    lcp_audiobook_response.raise_for_status()
 
 
 if __name__ == "__main__":
@@ -34,7 +34,7 @@ def get_progress(position: float, duration: float) -> float:
     return position / duration
 
 
-@dataclass
+@dataclass(slots=True)
 class TrackPosition:
     track: Track
     timestamp: int
@@ -126,7 +126,7 @@ class TrackPosition:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Track:
     href: str
     title: str | None
@@ -197,7 +197,7 @@ class Tracks:
         self.total_duration_ms = sum(track.duration_ms for track in self.tracks)
 
 
-@dataclass
+@dataclass(slots=True)
 class Chapter:
     title: str
     position: TrackPosition
@@ -303,7 +303,7 @@ class PalaceMediaPlayer:
         if not manifest_file.exists():
             raise FileNotFoundError(f"File {manifest_file} does not exist")
 
-        self.manifest = Manifest.parse_file(manifest_file)
+        self.manifest = Manifest.model_validate_json(manifest_file.read_bytes())
         self.tracks = Tracks(self.manifest)
 
         self.instance = vlc.Instance()
@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 
 import asyncio
-import json
 
 import typer
 
@@ -88,7 +87,7 @@ def patron_bookshelf(
         )
     )
     if as_json:
-        print(json.dumps(bookshelf.dict(), indent=2))
+        print(bookshelf.model_dump_json(indent=2))
     else:
         print_bookshelf_summary(bookshelf)
 
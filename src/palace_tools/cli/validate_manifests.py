@@ -1,9 +1,9 @@
-import json
 from pathlib import Path
 from textwrap import indent
 
 import typer
 from pydantic import ValidationError
+from pydantic_core import from_json
 
 from palace_tools.cli.summarize_rwpm_audio_manifest import text_with_time_delta
 from palace_tools.models.internal.rwpm_audio.audiobook import Audiobook
@@ -114,7 +114,7 @@ def command(
             errors.append(f"{e}")
 
         if errors:
-            manifest_raw = json.loads(manifest_file.read_text())
+            manifest_raw = from_json(manifest_file.read_bytes())
             manifest_metadata = manifest_raw.get("metadata", {})
             manifest_identifier = manifest_metadata.get("identifier")
             manifest_language = manifest_metadata.get("language")
@@ -1,6 +1,7 @@
 import base64
 import json
 import sys
+from typing import BinaryIO
 
 import httpx
 
@@ -10,16 +11,17 @@ QA_BASE_URL = "https://axis360apiqa.baker-taylor.com/Services/VendorAPI/"
 access_token_endpoint = "accesstoken"
 availability_endpoint = "availability/v2"
 
+STREAM_CHUNK_SIZE = 64 * 1024
+
 
 def get_headers(
-    base_url: str, username: str, password: str, library_id: str
+    http: httpx.Client, base_url: str, username: str, password: str, library_id: str
 ) -> dict[str, str]:
-    authorization_str = ":".join([username, password, library_id])
-    authorization_bytes = authorization_str.encode("utf_16_le")
-    authorization_b64 = base64.standard_b64encode(authorization_bytes)
-    resp = httpx.post(
+    authorization_bytes = ":".join([username, password, library_id]).encode("utf_16_le")
+    authorization_b64 = base64.b64encode(authorization_bytes).decode("ascii")
+    resp = http.post(
         base_url + access_token_endpoint,
-        headers={"Authorization": f"Basic {authorization_b64.decode('utf-8')}"},
+        headers={"Authorization": f"Basic {authorization_b64}"},
     )
     if resp.status_code != 200:
         print(f"Error: {resp.status_code}")
@@ -32,12 +34,19 @@ def get_headers(
     }
 
 
-def availability(base_url: str, username: str, password: str, library_id: str) -> str:
-    headers = get_headers(base_url, username, password, library_id)
-    resp = httpx.get(
-        base_url + availability_endpoint,
-        headers=headers,
-        params={"updatedDate": "1970-01-01 00:00:00"},
-        timeout=30.0,
-    )
-    return resp.text
+def availability_stream(
+    base_url: str, username: str, password: str, library_id: str, sink: BinaryIO
+) -> None:
+    """Write the availability feed to `sink` as it arrives, without buffering it."""
+    # Share one client, so that the token and availability requests reuse a connection.
+    with httpx.Client(http2=True) as http:
+        headers = get_headers(http, base_url, username, password, library_id)
+        with http.stream(
+            "GET",
+            base_url + availability_endpoint,
+            headers=headers,
+            params={"updatedDate": "1970-01-01 00:00:00"},
+            timeout=30.0,
+        ) as resp:
+            for chunk in resp.iter_bytes(chunk_size=STREAM_CHUNK_SIZE):
+                sink.write(chunk)
@@ -3,7 +3,6 @@ from __future__ import annotations
 import json
 import math
 import sys
-from base64 import b64encode
 from collections.abc import Callable, Generator, Mapping
 from enum import Enum
 from typing import Any, NamedTuple, TextIO
@@ -11,6 +10,8 @@ from typing import Any, NamedTuple, TextIO
 import httpx
 from rich.progress import MofNCompleteColumn, Progress, SpinnerColumn
 
+from palace_tools.utils.http.basic_auth import basic_auth_header
+
 
 class AuthType(Enum):
     BASIC = "basic"
@@ -78,9 +79,7 @@ class OAuthAuth(httpx.Auth):
 
     @staticmethod
     def _oauth_token_request(url: str, username: str, password: str) -> httpx.Request:
-        userpass = ":".join((username, password))
-        token = b64encode(userpass.encode()).decode()
-        headers = {"Authorization": f"Basic {token}"}
+        headers = basic_auth_header(username, password)
         return httpx.Request(
             "POST", url, headers=headers, data={"grant_type": "client_credentials"}
         )
@@ -167,14 +166,14 @@ def make_request(session: httpx.Client, url: str) -> dict[str, Any]:
 
 
 def write_json(file: TextIO, data: list[dict[str, Any]]) -> None:
-    file.write(json.dumps(data, indent=4))
+    json.dump(data, file, indent=4)
 
 
 def fetch(
     url: str, username: str | None, password: str | None, auth_type: AuthType
 ) -> list[dict[str, Any]]:
     # Create a session to fetch the documents
-    client = httpx.Client()
+    client = httpx.Client(http2=True)
 
     client.headers.update(
         {
@@ -205,20 +204,21 @@ def fetch(
     else:
         pages = math.ceil(items / items_per_page)
 
-    # Fetch the rest of the pages:
-    next_url: str | None = url
+    # Process the page we have, then fetch the next one, starting from the first page:
     with Progress(
         SpinnerColumn(), *Progress.get_default_columns(), MofNCompleteColumn()
     ) as progress:
         download_task = progress.add_task(f"Downloading Feed", total=pages)
-        while next_url is not None:
-            response = make_request(client, next_url)
+        while True:
             publications.extend(response["publications"])
-            next_url = None
+            progress.update(download_task, advance=1)
+            next_url: str | None = None
             for link in response["links"]:
                 if link["rel"] == "next":
                     next_url = link["href"]
                     break
-            progress.update(download_task, advance=1)
+            if next_url is None:
+                break
+            response = make_request(client, next_url)
 
     return publications
@@ -19,11 +19,22 @@ def parse_links(feed: str) -> dict[str, OpdsLinkTuple]:
     }
 
 
-def make_request(session: httpx.Client, url: str) -> str:
+def make_request(session: httpx.Client, url: str) -> httpx.Response:
     response = session.get(url)
     if response.status_code != 200:
         error_and_exit(response)
-    return response.text
+    return response
+
+
+def next_url_for(response: httpx.Response) -> str | None:
+    """Return the URL of the next page of the feed, if there is one.
+
+    We check for a `Link` HTTP header first, since that saves us parsing the feed.
+    """
+    if (link := response.links.get("next")) is not None and "url" in link:
+        return str(response.url.join(link["url"]))
+    links = parse_links(response.text)
+    return links.get("next") and links["next"].href
 
 
 def fetch(
@@ -34,7 +45,7 @@ def fetch(
     output_file: Path,
 ) -> None:
     # Create a session to fetch the documents
-    client = httpx.Client()
+    client = httpx.Client(http2=True)
 
     client.headers.update(
         {
@@ -63,7 +74,6 @@ def fetch(
             download_task = progress.add_task(f"Downloading Feed", total=None)
             while next_url is not None:
                 response = make_request(client, next_url)
-                file.write(response)
-                links = parse_links(response)
-                next_url = links.get("next") and links["next"].href
+                file.write(response.text)
+                next_url = next_url_for(response)
                 progress.update(download_task, advance=1)
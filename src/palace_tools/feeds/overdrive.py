@@ -5,6 +5,8 @@ import json
 import math
 import sys
 from collections import defaultdict, deque
+from collections.abc import AsyncGenerator, Sequence
+from contextlib import asynccontextmanager
 from typing import Any
 
 import httpx
@@ -22,6 +24,10 @@ ADVANTAGE_LIBRARY_ENDPOINT = (
 )
 
 
+class FetchError(Exception):
+    """A library's feed could not be fetched."""
+
+
 def handle_error(resp: Response) -> None:
     if resp.status_code == 200:
         return
@@ -29,7 +35,7 @@ def handle_error(resp: Response) -> None:
     print(f"Error: {resp.status_code}")
     print(f"Headers: {json.dumps(dict(resp.headers), indent=4)}")
     print(resp.text)
-    sys.exit(-1)
+    raise FetchError(f"Unexpected response {resp.status_code} from {resp.url}")
 
 
 async def get_auth_token(
@@ -76,20 +82,6 @@ def event_url(
     return url + "?" + "&".join(f"{k}={v}" for k, v in params.items())
 
 
-def make_request(
-    client: httpx.AsyncClient,
-    urls: deque[str] | str,
-    pending_requests: list[asyncio.Task[Response]],
-) -> None:
-    if isinstance(urls, str):
-        url = urls
-    else:
-        url = urls.pop()
-    req = client.get(url)
-    task = asyncio.create_task(req)
-    pending_requests.append(task)
-
-
 def process_request(
     response: Response,
     request_metadata: bool,
@@ -124,17 +116,12 @@ def process_request(
         raise RuntimeError(f"Unknown URL: {response.url}")
 
 
-async def fetch(
-    base_url: str,
-    client_key: str,
-    client_secret: str,
-    library_id: str,
-    parent_library_id: str | None,
-    fetch_metadata: bool,
-    fetch_availability: bool,
-    connections: int,
-) -> list[dict[str, Any]]:
+@asynccontextmanager
+async def authenticated_client(
+    base_url: str, client_key: str, client_secret: str, connections: int
+) -> AsyncGenerator[httpx.AsyncClient, None]:
     async with httpx.AsyncClient(
+        http2=True,
         timeout=Timeout(20.0, pool=None),
         limits=Limits(
             max_connections=connections,
@@ -146,75 +133,181 @@ async def fetch(
 
         client.headers.update(get_headers(auth_token))
         client.base_url = URL(base_url)
+        yield client
 
-        collection_token = await get_collection_token(
-            client, library_id, parent_library_id
-        )
 
-        first_page = await client.get(event_url(collection_token))
-        handle_error(first_page)
-        first_page_data = first_page.json()
+async def fetch(
+    base_url: str,
+    client_key: str,
+    client_secret: str,
+    library_id: str,
+    parent_library_id: str | None,
+    fetch_metadata: bool,
+    fetch_availability: bool,
+    connections: int,
+) -> list[dict[str, Any]]:
+    try:
+        async with authenticated_client(
+            base_url, client_key, client_secret, connections
+        ) as client:
+            with Progress(
+                SpinnerColumn(), *Progress.get_default_columns(), MofNCompleteColumn()
+            ) as progress:
+                return await fetch_library(
+                    client,
+                    progress,
+                    base_url,
+                    library_id,
+                    parent_library_id,
+                    fetch_metadata,
+                    fetch_availability,
+                    connections,
+                )
+    except FetchError as e:
+        print(e)
+        sys.exit(-1)
 
-        items = first_page_data["totalItems"]
-        items_per_page = first_page_data["limit"]
-        pages = math.ceil(items / items_per_page)
 
-        fetches = (
-            pages
-            + (items if fetch_metadata else 0)
-            + (items * 2 if fetch_availability else 0)
-        )
+async def fetch_batch(
+    base_url: str,
+    client_key: str,
+    client_secret: str,
+    library_ids: Sequence[str],
+    parent_library_id: str | None,
+    fetch_metadata: bool,
+    fetch_availability: bool,
+    connections: int,
+) -> dict[str, list[dict[str, Any]] | BaseException]:
+    """Fetch the feeds for several libraries concurrently, over a shared client.
+
+    Returns the products for each library, or the exception that its fetch raised.
+    Raises FetchError if we can't authenticate, since then no library can be fetched.
+    """
+    async with authenticated_client(
+        base_url, client_key, client_secret, connections
+    ) as client:
         with Progress(
             SpinnerColumn(), *Progress.get_default_columns(), MofNCompleteColumn()
         ) as progress:
-            download_task = progress.add_task(f"Downloading Feed", total=fetches)
-            urls: deque[str] = deque()
-            pending_requests: list[asyncio.Task[Response]] = []
-            products: dict[str, Any] = {}
-            retried_requests: defaultdict[str, int] = defaultdict(int)
+            # The libraries' workers share one client, so they share one set of
+            # request slots matching its connection pool.
+            request_slots = asyncio.Semaphore(connections)
+            results = await asyncio.gather(
+                *(
+                    fetch_library(
+                        client,
+                        progress,
+                        base_url,
+                        library_id,
+                        parent_library_id,
+                        fetch_metadata,
+                        fetch_availability,
+                        connections,
+                        task_label=f"Downloading {library_id}",
+                        request_slots=request_slots,
+                    )
+                    for library_id in library_ids
+                ),
+                return_exceptions=True,
+            )
+    return dict(zip(library_ids, results))
+
+
+async def fetch_library(
+    client: httpx.AsyncClient,
+    progress: Progress,
+    base_url: str,
+    library_id: str,
+    parent_library_id: str | None,
+    fetch_metadata: bool,
+    fetch_availability: bool,
+    connections: int,
+    task_label: str = "Downloading Feed",
+    request_slots: asyncio.Semaphore | None = None,
+) -> list[dict[str, Any]]:
+    """Crawl one library's collection.
 
-            for i in range(pages):
-                urls.append(event_url(collection_token, offset=i * items_per_page))
+    Raises FetchError if a request fails, or keeps failing after retries.
 
-            for i in range(min(connections * 2, len(urls))):
-                make_request(client, urls, pending_requests)
+    :param request_slots: Bounds the requests in flight. Share one across
+        concurrent crawls on the same client to keep them within its pool.
+    """
+    collection_token = await get_collection_token(client, library_id, parent_library_id)
 
-            while pending_requests:
-                done, pending = await asyncio.wait(
-                    pending_requests, return_when=asyncio.FIRST_COMPLETED
-                )
+    first_page = await client.get(event_url(collection_token))
+    handle_error(first_page)
+    first_page_data = first_page.json()
+
+    items = first_page_data["totalItems"]
+    items_per_page = first_page_data["limit"]
+    pages = math.ceil(items / items_per_page)
 
-                pending_requests = list(pending)
-                events_path = EVENTS_ENDPOINT % {"collection_token": collection_token}
-
-                for req in done:
-                    try:
-                        response = await req
-                        process_request(
-                            response,
-                            fetch_metadata,
-                            fetch_availability,
-                            base_url,
-                            events_path,
-                            products,
-                            urls,
-                        )
-                        progress.update(download_task, advance=1)
-                    except (RequestError, HTTPStatusError) as e:
-                        print(f"Request error: {e}")
-                        print(f"URL: {e.request.url}")
-                        request_url = str(e.request.url)
-                        retried_requests[request_url] += 1
-
-                        if retried_requests[request_url] > 3:
-                            print("Too many retries. Exiting.")
-                            sys.exit(-1)
-                        else:
-                            print(
-                                f"Retrying request (attempt {retried_requests[request_url]}/3)"
-                            )
-                            urls.appendleft(request_url)
-                    if urls:
-                        make_request(client, urls, pending_requests)
+    fetches = (
+        pages
+        + (items if fetch_metadata else 0)
+        + (items * 2 if fetch_availability else 0)
+    )
+    download_task = progress.add_task(task_label, total=fetches)
+    slots = request_slots or asyncio.Semaphore(connections)
+    urls: asyncio.Queue[str] = asyncio.Queue()
+    products: dict[str, Any] = {}
+    retried_requests: defaultdict[str, int] = defaultdict(int)
+    events_path = EVENTS_ENDPOINT % {"collection_token": collection_token}
+
+    for i in range(pages):
+        urls.put_nowait(event_url(collection_token, offset=i * items_per_page))
+
+    async def worker() -> None:
+        new_urls: deque[str] = deque()
+        while True:
+            url = await urls.get()
+            try:
+                async with slots:
+                    response = await client.get(url)
+                process_request(
+                    response,
+                    fetch_metadata,
+                    fetch_availability,
+                    base_url,
+                    events_path,
+                    products,
+                    new_urls,
+                )
+                progress.update(download_task, advance=1)
+                if retried_requests:
+                    # Only URLs that are still failing need a retry count.
+                    retried_requests.pop(str(response.url), None)
+            except (RequestError, HTTPStatusError) as e:
+                print(f"Request error: {e}")
+                print(f"URL: {e.request.url}")
+                request_url = str(e.request.url)
+                retried_requests[request_url] += 1
+
+                if retried_requests[request_url] > 3:
+                    raise FetchError(f"Too many retries for {request_url}") from e
+                else:
+                    print(
+                        f"Retrying request (attempt {retried_requests[request_url]}/3)"
+                    )
+                    new_urls.append(request_url)
+            finally:
+                while new_urls:
+                    urls.put_nowait(new_urls.popleft())
+                urls.task_done()
+
+    # A fixed pool of workers pulls from the queue, so each completion costs
+    # O(1), rather than re-waiting on every pending request.
+    workers = [asyncio.create_task(worker()) for _ in range(connections)]
+    all_fetched = asyncio.create_task(urls.join())
+    try:
+        done, _ = await asyncio.wait(
+            [all_fetched, *workers], return_when=asyncio.FIRST_COMPLETED
+        )
+    finally:
+        for task in [all_fetched, *workers]:
+            task.cancel()
+    # Workers only finish early if they fail, so surface their exceptions.
+    for task in done:
+        task.result()
 
     return list(products.values())
@@ -36,10 +36,20 @@ class ToCEntry(BaseModel):
 
     @classmethod
     def from_track(cls, track: AudioTrack, default_title: str = "Track") -> Self:
-        """Create a ToCEntry from an AudioTrack."""
-        toc_href = f"{track.href}#t=0"
-        toc_title = track.title or default_title
-        return cls(href=toc_href, title=toc_title)
+        """Create a ToCEntry from an AudioTrack.
+
+        The track has already been validated and we know the computed values,
+        so we construct the entry directly, rather than running the validators.
+        """
+        # The pydantic mypy plugin types model_construct as returning the
+        # defining class, rather than Self.
+        return cls.model_construct(  # type: ignore[return-value]
+            href=f"{track.href}#t=0",
+            title=track.title or default_title,
+            children=None,
+            track_href=track.href,
+            track_offset=0,
+        )
 
 
 ToCEntries = Sequence[ToCEntry]
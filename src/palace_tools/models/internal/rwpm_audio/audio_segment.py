@@ -7,7 +7,7 @@ from palace_tools.models.api.rwpm_audiobook import AudioTrack, ToCEntry
 from palace_tools.utils.iteration import sliding_window
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioSegment:
     track: AudioTrack
     start: int
@@ -24,7 +24,7 @@ class AudioSegment:
         self.actual_duration = self.end_actual - self.start
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToCTrackBoundaries:
     toc_entry: ToCEntry
     first_track_index: int
@@ -34,7 +34,7 @@ class ToCTrackBoundaries:
     last_track_end_actual_offset: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToCAudioSegmentSequence:
     toc_entry: ToCEntry
     audio_segments: Sequence[AudioSegment]
@@ -65,24 +65,31 @@ class Audiobook:
         toc: Sequence[ToCEntry] | None,
         depth: int = 0,
     ) -> Sequence[EnhancedToCEntry]:
-        """Recursively generate enhanced ToC entries."""
+        """Recursively generate enhanced ToC entries.
+
+        The ToC entries have already been validated as part of the manifest,
+        so we construct the enhanced entries from them without re-validating.
+        """
         return (
             [
-                EnhancedToCEntry(
+                EnhancedToCEntry.model_construct(
                     depth=depth,
                     duration=sum(
                         segment.duration
                         for segment in self.segments_by_toc_id[id(entry)]
                     ),
-                    actual_duration=sum(
-                        segment.actual_duration
-                        for segment in self.segments_by_toc_id[id(entry)]
+                    # model_construct doesn't coerce, so match what validation produced.
+                    actual_duration=float(
+                        sum(
+                            segment.actual_duration
+                            for segment in self.segments_by_toc_id[id(entry)]
+                        )
                     ),
                     audio_segments=self.segments_by_toc_id[id(entry)],
                     sub_entries=self.generate_enhanced_toc(
                         toc=entry.children, depth=depth + 1
                     ),
-                    **entry.dict(),
+                    **dict(entry),
                 )
                 for entry in toc
             ]
@@ -136,7 +143,7 @@ class Audiobook:
     @classmethod
     def from_manifest_file(cls, filepath: Path | str) -> Self:
         directory_path = Path(filepath).parent
-        manifest = Manifest.parse_file(filepath)
+        manifest = Manifest.model_validate_json(Path(filepath).read_bytes())
         for track in manifest.reading_order:
             # Try to load the track
             track_file = directory_path / track.href
@@ -49,10 +49,10 @@ class AuthenticatedPatron(PatronAuthorization):
         async with HTTPXAsyncClient.with_existing_client(
             existing_client=http_client
         ) as client:
-            profile = validate_response(
+            response = validate_response(
                 await client.get(patron_profile_link.href, headers=headers)
-            ).json()
-        return PatronProfileDocument.model_validate(profile)
+            )
+        return PatronProfileDocument.model_validate_json(response.content)
 
     async def patron_bookshelf(
         self, http_client: HTTPXAsyncClient | None = None
@@ -62,10 +62,10 @@ class AuthenticatedPatron(PatronAuthorization):
         async with HTTPXAsyncClient.with_existing_client(
             existing_client=http_client
         ) as client:
-            bookshelf = validate_response(
+            response = validate_response(
                 await client.get(patron_bookshelf_link.href, headers=headers)
-            ).json()
-        return OPDS2Feed.model_validate(bookshelf)
+            )
+        return OPDS2Feed.model_validate_json(response.content)
 
 
 async def authenticate(
@@ -166,12 +166,12 @@ async def _get_patron_token(
             async with HTTPXAsyncClient.with_existing_client(
                 existing_client=http_client
             ) as client:
-                token_obj = validate_response(
+                response = validate_response(
                     await client.post(
                         authentication_link.href, headers=basic_auth_header
                     )
-                ).json()
-            return OAuthToken.model_validate(token_obj)
+                )
+            return OAuthToken.model_validate_json(response.content)
         case _:
             raise NotImplementedError(
                 f"Unsupported authentication mechanism: {auth_mech.type}"
@@ -185,8 +185,8 @@ async def fetch_auth_document(
     async with HTTPXAsyncClient.with_existing_client(
         existing_client=http_client
     ) as client:
-        document = validate_response(await client.get(url)).json()
-    return AuthenticationDocument.parse_obj(document)
+        response = validate_response(await client.get(url))
+    return AuthenticationDocument.model_validate_json(response.content)
 
 
 async def get_auth_document_url(
@@ -16,6 +16,9 @@ else:
 
 class HTTPXAsyncClient(AsyncClient):
     def __init__(self, user_agent: str = DEFAULT_USER_AGENT, **kwargs: Any) -> None:
+        # Multiplex the requests made over a client's lifetime (e.g., the
+        # auth document, token, and feed requests) on a single connection.
+        kwargs.setdefault("http2", True)
         super().__init__(**kwargs)
         self.user_agent = user_agent
 
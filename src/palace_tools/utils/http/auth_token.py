@@ -1,13 +1,13 @@
 import datetime
 import sys
 from abc import ABC, abstractmethod
-from base64 import b64encode
 from collections.abc import Mapping
 from functools import cached_property
 from typing import Protocol
 
 from palace_tools.models.api.util import ApiBaseModel
 from palace_tools.utils.datetime import utc_now
+from palace_tools.utils.http.basic_auth import basic_auth_token
 
 if sys.version_info < (3, 11):
     from typing_extensions import Self
@@ -15,11 +15,6 @@ else:
     from typing import Self
 
 
-def basic_auth_header(username: str, password: str) -> Mapping[str, str]:
-    token = b64encode(bytes(f"{username}:{password}", "utf-8")).decode("ISO-8859-1")
-    return {"Authorization": f"Basic {token}"}
-
-
 class AuthorizationToken(Protocol):
     access_token: str
     token_type: str
@@ -64,8 +59,9 @@ class BasicAuthToken(BaseAuthorizationToken):
     def from_username_and_password(cls, username: str, password: str | None) -> Self:
         if password is None:
             password = ""
-        token = b64encode(bytes(f"{username}:{password}", "utf-8")).decode("ISO-8859-1")
-        return cls(access_token=token, token_type="Basic")
+        return cls(
+            access_token=basic_auth_token(username, password), token_type="Basic"
+        )
 
     @property
     def is_valid(self) -> bool:
@@ -0,0 +1,11 @@
+from base64 import b64encode
+from collections.abc import Mapping
+
+
+def basic_auth_token(username: str, password: str) -> str:
+    """Base64-encoded credentials for HTTP Basic authentication."""
+    return b64encode(username.encode() + b":" + password.encode()).decode("ascii")
+
+
+def basic_auth_header(username: str, password: str) -> Mapping[str, str]:
+    return {"Authorization": f"Basic {basic_auth_token(username, password)}"}
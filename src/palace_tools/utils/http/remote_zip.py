@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import io
+import struct
+import zipfile
+
+from httpx import AsyncClient
+
+from palace_tools.utils.http.async_client import HTTPXAsyncClient
+
+# The end of central directory record is 22 bytes, followed by a comment of up
+# to 64 KiB. Fetching this much of the tail of the archive guarantees that we get it.
+_END_OF_CENTRAL_DIRECTORY_SIZE = 22
+_TAIL_SIZE = (1 << 16) + _END_OF_CENTRAL_DIRECTORY_SIZE
+_END_OF_CENTRAL_DIRECTORY_SIGNATURE = b"PK\x05\x06"
+_LOCAL_FILE_HEADER_SIZE = 30
+_ZIP64_MARKER = 0xFFFFFFFF
+
+
+class _RangesUnsupported(Exception):
+    """The server did not honour a range request."""
+
+
+class _PartialRemoteFile(io.RawIOBase):
+    """A read-only, seekable view of a remote file, backed by the byte ranges fetched so far.
+
+    Each read must fall entirely within a single fetched range.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._ranges: dict[int, bytes] = {}
+        self._position = 0
+
+    def add_range(self, start: int, data: bytes) -> None:
+        self._ranges[start] = data
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self.size
+        self._position = offset
+        return offset
+
+    def read(self, size: int | None = -1) -> bytes:
+        end = (
+            self.size
+            if size is None or size < 0
+            else min(self.size, self._position + size)
+        )
+        for start, data in self._ranges.items():
+            if start <= self._position and end <= start + len(data):
+                chunk = data[self._position - start : end - start]  # noqa: E203
+                self._position = end
+                return chunk
+        raise ValueError(
+            f"Bytes {self._position}-{end} of the remote file have not been fetched."
+        )
+
+
+async def _fetch_range(client: AsyncClient, url: str, start: int, end: int) -> bytes:
+    """Fetch the bytes in the half-open range [start, end) of a remote file."""
+    response = await client.get(url, headers={"Range": f"bytes={start}-{end - 1}"})
+    if response.status_code == 416:
+        raise _RangesUnsupported()
+    response.raise_for_status()
+    if response.status_code != 206 or len(response.content) != end - start:
+        raise _RangesUnsupported()
+    return response.content
+
+
+async def fetch_zip_member(
+    url: str,
+    /,
+    member_name: str,
+    http_client: HTTPXAsyncClient | None = None,
+) -> bytes | None:
+    """Fetch a single member of a remote ZIP archive, without downloading the whole archive.
+
+    :param url: The URL of the ZIP archive.
+    :param member_name: The name of the member to extract.
+    :param http_client: An optional HTTP client to use.
+    :return: The member's content, or None if the server does not support range requests.
+
+    We fetch the tail of the archive to locate its central directory, and then
+    fetch only the local header and compressed data of the requested member.
+    """
+    async with HTTPXAsyncClient.with_existing_client(
+        existing_client=http_client
+    ) as client:
+        try:
+            return await _fetch_zip_member(client, url, member_name)
+        except _RangesUnsupported:
+            return None
+
+
+async def _fetch_zip_member(
+    client: AsyncClient, url: str, member_name: str
+) -> bytes | None:
+    async with client.stream(
+        "GET", url, headers={"Range": f"bytes=-{_TAIL_SIZE}"}
+    ) as response:
+        if response.status_code == 416:
+            return None
+        response.raise_for_status()
+        content_range = response.headers.get("Content-Range", "")
+        if response.status_code != 206 or "/" not in content_range:
+            return None
+        tail = await response.aread()
+
+    total = content_range.rsplit("/", maxsplit=1)[1]
+    if not total.isdigit():
+        # The server didn't tell us the archive's size (`bytes a-b/*`).
+        return None
+    size = int(total)
+    tail_start = size - len(tail)
+
+    eocd_offset = tail.rfind(_END_OF_CENTRAL_DIRECTORY_SIGNATURE)
+    if eocd_offset == -1:
+        raise zipfile.BadZipFile(f"No end of central directory found in {url}.")
+    (central_directory_offset,) = struct.unpack_from("<L", tail, eocd_offset + 16)
+    if central_directory_offset == _ZIP64_MARKER:
+        # Let the caller fall back to a full download for ZIP64 archives.
+        return None
+    if central_directory_offset < tail_start:
+        tail = (
+            await _fetch_range(client, url, central_directory_offset, tail_start) + tail
+        )
+        tail_start = central_directory_offset
+
+    remote_file = _PartialRemoteFile(size)
+    remote_file.add_range(tail_start, tail)
+    zf: zipfile.ZipFile = zipfile.ZipFile(remote_file)  # type: ignore[call-overload]
+    info = zf.getinfo(member_name)
+
+    header_start = info.header_offset
+    header = await _fetch_range(
+        client, url, header_start, header_start + _LOCAL_FILE_HEADER_SIZE
+    )
+    name_length, extra_length = struct.unpack_from("<HH", header, 26)
+    data_start = header_start + _LOCAL_FILE_HEADER_SIZE + name_length + extra_length
+    data = await _fetch_range(
+        client,
+        url,
+        header_start + _LOCAL_FILE_HEADER_SIZE,
+        data_start + info.compress_size,
+    )
+    remote_file.add_range(header_start, header + data)
+
+    return zf.read(info)
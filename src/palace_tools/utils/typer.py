@@ -1,6 +1,7 @@
 #
 # Helpers for the `typer` package.
 #
+import asyncio
 import sys
 import traceback
 from typing import Any
@@ -8,11 +9,21 @@ from typing import Any
 import typer
 
 
+def install_uvloop() -> None:
+    """Use uvloop for the asyncio event loop, when it is available (not on Windows)."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def run_typer_app_as_main(app: typer.Typer, *args: Any, **kwargs: Any) -> Any | None:
     """Run a typer app as the main function.
 
     Catch any uncaught exceptions and print them to stderr.
     """
+    install_uvloop()
     try:
         return app(*args, **kwargs)
     except typer.Exit as e: